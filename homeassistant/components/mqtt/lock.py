@@ -1,7 +1,10 @@
 """Support for MQTT locks."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 import functools
+import sys
 
 import voluptuous as vol
 
@@ -43,6 +46,9 @@ DEFAULT_PAYLOAD_OPEN = "OPEN"
 DEFAULT_STATE_LOCKED = "LOCKED"
 DEFAULT_STATE_UNLOCKED = "UNLOCKED"
 
+_FEATURES_NO_OPEN = 0
+_FEATURES_WITH_OPEN = SUPPORT_OPEN
+
 MQTT_LOCK_ATTRIBUTES_BLOCKED = frozenset(
     {
         lock.ATTR_CHANGED_BY,
@@ -84,11 +90,58 @@ async def async_setup_entry(
 ) -> None:
     """Set up MQTT lock dynamically through MQTT discovery."""
     setup = functools.partial(
-        _async_setup_entity, hass, async_add_entities, config_entry=config_entry
+        _async_setup_entity,
+        hass,
+        _async_batch_add_entities(hass, config_entry, async_add_entities),
+        config_entry=config_entry,
     )
     await async_setup_entry_helper(hass, lock.DOMAIN, setup, DISCOVERY_SCHEMA)
 
 
+def _async_batch_add_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> AddEntitiesCallback:
+    """Return a callback that adds entities once per event loop iteration."""
+    pending: list[MqttLock] = []
+    flush_handle: asyncio.Handle | None = None
+
+    @callback
+    def _async_flush() -> None:
+        """Add all entities queued since the last flush."""
+        nonlocal flush_handle
+        flush_handle = None
+        entities = pending.copy()
+        pending.clear()
+        async_add_entities(entities)
+
+    @callback
+    def _async_add(
+        new_entities: Iterable[MqttLock], update_before_add: bool = False
+    ) -> None:
+        """Queue entities to be added on the next loop iteration."""
+        nonlocal flush_handle
+        if update_before_add:
+            async_add_entities(new_entities, update_before_add=True)
+            return
+        pending.extend(new_entities)
+        if flush_handle is None:
+            flush_handle = hass.loop.call_soon(_async_flush)
+
+    @callback
+    def _async_cancel() -> None:
+        """Drop queued entities when the config entry is unloaded."""
+        nonlocal flush_handle
+        if flush_handle is not None:
+            flush_handle.cancel()
+            flush_handle = None
+        pending.clear()
+
+    config_entry.async_on_unload(_async_cancel)
+    return _async_add
+
+
 async def _async_setup_entity(
     hass, async_add_entities, config, config_entry=None, discovery_data=None
 ):
@@ -104,7 +157,7 @@ class MqttLock(MqttEntity, LockEntity):
 
     def __init__(self, hass, config, config_entry, discovery_data):
         """Initialize the lock."""
-        self._state = False
+        self._attr_is_locked = False
         self._optimistic = False
 
         MqttEntity.__init__(self, hass, config, config_entry, discovery_data)
@@ -117,6 +170,23 @@ class MqttLock(MqttEntity, LockEntity):
     def _setup_from_config(self, config):
         """(Re)Setup the entity."""
         self._optimistic = config[CONF_OPTIMISTIC]
+        self._attr_assumed_state = self._optimistic
+        self._command_topic = config[CONF_COMMAND_TOPIC]
+        self._payload_lock = sys.intern(config[CONF_PAYLOAD_LOCK])
+        self._payload_unlock = sys.intern(config[CONF_PAYLOAD_UNLOCK])
+        self._payload_open = None
+        if (payload_open := config.get(CONF_PAYLOAD_OPEN)) is not None:
+            self._payload_open = sys.intern(payload_open)
+        self._qos = config[CONF_QOS]
+        self._retain = config[CONF_RETAIN]
+        self._encoding = config[CONF_ENCODING]
+        self._state_map = {
+            config[CONF_STATE_LOCKED]: True,
+            config[CONF_STATE_UNLOCKED]: False,
+        }
+        self._attr_supported_features = (
+            _FEATURES_WITH_OPEN if CONF_PAYLOAD_OPEN in config else _FEATURES_NO_OPEN
+        )
 
         self._value_template = MqttValueTemplate(
             self._config.get(CONF_VALUE_TEMPLATE),
@@ -125,22 +195,10 @@ class MqttLock(MqttEntity, LockEntity):
 
     def _prepare_subscribe_topics(self):
         """(Re)Subscribe to topics."""
-
-        @callback
-        @log_messages(self.hass, self.entity_id)
-        def message_received(msg):
-            """Handle new MQTT messages."""
-            payload = self._value_template(msg.payload)
-            if payload == self._config[CONF_STATE_LOCKED]:
-                self._state = True
-            elif payload == self._config[CONF_STATE_UNLOCKED]:
-                self._state = False
-
-            self.async_write_ha_state()
-
         if self._config.get(CONF_STATE_TOPIC) is None:
             # Force into optimistic mode.
             self._optimistic = True
+            self._attr_assumed_state = True
         else:
             self._sub_state = subscription.async_prepare_subscribe_topics(
                 self.hass,
@@ -148,47 +206,45 @@ class MqttLock(MqttEntity, LockEntity):
                 {
                     "state_topic": {
                         "topic": self._config.get(CONF_STATE_TOPIC),
-                        "msg_callback": message_received,
-                        "qos": self._config[CONF_QOS],
-                        "encoding": self._config[CONF_ENCODING] or None,
+                        "msg_callback": log_messages(
+                            self.hass, self.entity_id
+                        )(self._handle_state_message),
+                        "qos": self._qos,
+                        "encoding": self._encoding or None,
                     }
                 },
             )
 
+    @callback
+    def _handle_state_message(self, msg):
+        """Handle new MQTT state messages."""
+        payload = self._value_template(msg.payload)
+        new_state = self._state_map.get(payload)
+        if new_state is None or new_state == self._attr_is_locked:
+            return
+
+        self._attr_is_locked = new_state
+        self.async_write_ha_state()
+
     async def _subscribe_topics(self):
         """(Re)Subscribe to topics."""
         await subscription.async_subscribe_topics(self.hass, self._sub_state)
 
-    @property
-    def is_locked(self):
-        """Return true if lock is locked."""
-        return self._state
-
-    @property
-    def assumed_state(self):
-        """Return true if we do optimistic updates."""
-        return self._optimistic
-
-    @property
-    def supported_features(self):
-        """Flag supported features."""
-        return SUPPORT_OPEN if CONF_PAYLOAD_OPEN in self._config else 0
-
     async def async_lock(self, **kwargs):
         """Lock the device.
 
         This method is a coroutine.
         """
         await self.async_publish(
-            self._config[CONF_COMMAND_TOPIC],
-            self._config[CONF_PAYLOAD_LOCK],
-            self._config[CONF_QOS],
-            self._config[CONF_RETAIN],
-            self._config[CONF_ENCODING],
+            self._command_topic,
+            self._payload_lock,
+            self._qos,
+            self._retain,
+            self._encoding,
         )
         if self._optimistic:
             # Optimistically assume that the lock has changed state.
-            self._state = True
+            self._attr_is_locked = True
             self.async_write_ha_state()
 
     async def async_unlock(self, **kwargs):
@@ -197,15 +253,15 @@ class MqttLock(MqttEntity, LockEntity):
         This method is a coroutine.
         """
         await self.async_publish(
-            self._config[CONF_COMMAND_TOPIC],
-            self._config[CONF_PAYLOAD_UNLOCK],
-            self._config[CONF_QOS],
-            self._config[CONF_RETAIN],
-            self._config[CONF_ENCODING],
+            self._command_topic,
+            self._payload_unlock,
+            self._qos,
+            self._retain,
+            self._encoding,
         )
         if self._optimistic:
             # Optimistically assume that the lock has changed state.
-            self._state = False
+            self._attr_is_locked = False
             self.async_write_ha_state()
 
     async def async_open(self, **kwargs):
@@ -213,14 +269,17 @@ class MqttLock(MqttEntity, LockEntity):
 
         This method is a coroutine.
         """
+        if self._payload_open is None:
+            # Opening is not supported without an open payload.
+            return
         await self.async_publish(
-            self._config[CONF_COMMAND_TOPIC],
-            self._config[CONF_PAYLOAD_OPEN],
-            self._config[CONF_QOS],
-            self._config[CONF_RETAIN],
-            self._config[CONF_ENCODING],
+            self._command_topic,
+            self._payload_open,
+            self._qos,
+            self._retain,
+            self._encoding,
         )
         if self._optimistic:
             # Optimistically assume that the lock unlocks when opened.
-            self._state = False
+            self._attr_is_locked = False
             self.async_write_ha_state()
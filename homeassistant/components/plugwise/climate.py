@@ -25,7 +25,9 @@ from .util import plugwise_command
 
 HVAC_MODES_HEAT_ONLY = [HVAC_MODE_HEAT, HVAC_MODE_AUTO, HVAC_MODE_OFF]
 HVAC_MODES_HEAT_COOL = [HVAC_MODE_HEAT, HVAC_MODE_COOL, HVAC_MODE_AUTO, HVAC_MODE_OFF]
-THERMOSTAT_CLASSES = ["thermostat", "zone_thermostat", "thermostatic_radiator_valve"]
+THERMOSTAT_CLASSES = frozenset(
+    {"thermostat", "zone_thermostat", "thermostatic_radiator_valve"}
+)
 
 
 async def async_setup_entry(
@@ -66,13 +68,16 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity):
         self._attr_unique_id = f"{device_id}-climate"
         self._attr_name = coordinator.data.devices[device_id].get("name")
 
+        self._heater_id = coordinator.data.gateway["heater_id"]
         self._loc_id = coordinator.data.devices[device_id]["location"]
+        self._last_fingerprint: tuple[Any, ...] | None = None
+        self._last_preset_names: tuple[str, ...] | None = None
 
     @plugwise_command
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
-        if ((temperature := kwargs.get(ATTR_TEMPERATURE)) is None) or (
-            self._attr_max_temp < temperature < self._attr_min_temp
+        if (temperature := kwargs.get(ATTR_TEMPERATURE)) is None or not (
+            self._attr_min_temp <= temperature <= self._attr_max_temp
         ):
             raise ValueError("Invalid temperature requested")
         await self.coordinator.api.set_temperature(self._loc_id, temperature)
@@ -106,20 +111,22 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         data = self.coordinator.data.devices[self._dev_id]
-        heater_central_data = self.coordinator.data.devices[
-            self.coordinator.data.gateway["heater_id"]
-        ]
+        gateway = self.coordinator.data.gateway
+        heater_central_data = self.coordinator.data.devices[self._heater_id]
+        sensors = data.get("sensors", {})
 
         # Current & set temperatures
-        if setpoint := data["sensors"].get("setpoint"):
+        if setpoint := sensors.get("setpoint"):
             self._attr_target_temperature = setpoint
-        if temperature := data["sensors"].get("temperature"):
+        if temperature := sensors.get("temperature"):
             self._attr_current_temperature = temperature
 
         # Presets handling
         self._attr_preset_mode = data.get("active_preset")
         if presets := data.get("presets"):
-            self._attr_preset_modes = list(presets)
+            if (preset_names := tuple(presets)) != self._last_preset_names:
+                self._attr_preset_modes = list(preset_names)
+                self._last_preset_names = preset_names
         else:
             self._attr_preset_mode = None
 
@@ -131,11 +138,15 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity):
             self._attr_hvac_action = CURRENT_HVAC_COOL
 
         # Determine hvac modes and current hvac mode
-        self._attr_hvac_modes = HVAC_MODES_HEAT_ONLY
-        if self.coordinator.data.gateway.get("cooling_present"):
-            self._attr_hvac_modes = HVAC_MODES_HEAT_COOL
-        if data.get("mode") in self._attr_hvac_modes:
-            self._attr_hvac_mode = data["mode"]
+        hvac_modes = (
+            HVAC_MODES_HEAT_COOL
+            if gateway.get("cooling_present")
+            else HVAC_MODES_HEAT_ONLY
+        )
+        if self._attr_hvac_modes is not hvac_modes:
+            self._attr_hvac_modes = hvac_modes
+        if (mode := data.get("mode")) in hvac_modes:
+            self._attr_hvac_mode = mode
 
         # Extra attributes
         self._attr_extra_state_attributes = {
@@ -143,4 +154,21 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity):
             "selected_schema": data.get("selected_schedule"),
         }
 
+        # Only write state when something observable changed
+        fingerprint = (
+            self.available,
+            self._attr_target_temperature,
+            self._attr_current_temperature,
+            self._attr_preset_mode,
+            self._attr_preset_modes,
+            self._attr_hvac_action,
+            self._attr_hvac_mode,
+            self._attr_hvac_modes,
+            tuple(data.get("available_schedules") or ()),
+            data.get("selected_schedule"),
+        )
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
         super()._handle_coordinator_update()
@@ -3,15 +3,17 @@ from __future__ import annotations
 
 from typing import Any
 
+from plugwise.exceptions import PlugwiseException
+
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .coordinator import PlugwiseDataUpdateCoordinator
 from .entity import PlugwiseEntity
-from .util import plugwise_command
 
 SWITCHES: tuple[SwitchEntityDescription, ...] = (
     SwitchEntityDescription(
@@ -31,10 +33,13 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     entities: list[PlugwiseSwitchEntity] = []
     for device_id, device in coordinator.data.devices.items():
-        for description in SWITCHES:
-            if "switches" not in device or description.key not in device["switches"]:
-                continue
-            entities.append(PlugwiseSwitchEntity(coordinator, device_id, description))
+        if (switches := device.get("switches")) is None:
+            continue
+        entities.extend(
+            PlugwiseSwitchEntity(coordinator, device_id, description)
+            for description in SWITCHES
+            if description.key in switches
+        )
     async_add_entities(entities)
 
 
@@ -50,30 +55,54 @@ class PlugwiseSwitchEntity(PlugwiseEntity, SwitchEntity):
         """Set up the Plugwise API."""
         super().__init__(coordinator, device_id)
         self.entity_description = description
+        self._key = description.key
         self._attr_unique_id = f"{device_id}-{description.key}"
-        self._attr_name = (f"{self.device.get('name', '')} {description.name}").lstrip()
+        self._attr_name = description.name
+        if dev_name := coordinator.data.devices[device_id].get("name"):
+            self._attr_name = f"{dev_name} {description.name}"
+        self._last_state: tuple[bool, bool | None] | None = None
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if entity is on."""
-        return self.device["switches"].get(self.entity_description.key)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        is_on = self._attr_is_on
+        if available := self.available:
+            is_on = self.device["switches"].get(self._key)
+        state = (available, is_on)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._attr_is_on = is_on
+        super()._handle_coordinator_update()
 
-    @plugwise_command
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the device on."""
-        await self.coordinator.api.set_switch_state(
-            self._dev_id,
-            self.device.get("members"),
-            self.entity_description.key,
-            "on",
-        )
+        try:
+            await self.coordinator.api.set_switch_state(
+                self._dev_id,
+                self.device.get("members"),
+                self._key,
+                "on",
+            )
+        except PlugwiseException as error:
+            raise HomeAssistantError(
+                f"Error communicating with API: {error}"
+            ) from error
+        finally:
+            await self.coordinator.async_request_refresh()
 
-    @plugwise_command
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
-        await self.coordinator.api.set_switch_state(
-            self._dev_id,
-            self.device.get("members"),
-            self.entity_description.key,
-            "off",
-        )
+        try:
+            await self.coordinator.api.set_switch_state(
+                self._dev_id,
+                self.device.get("members"),
+                self._key,
+                "off",
+            )
+        except PlugwiseException as error:
+            raise HomeAssistantError(
+                f"Error communicating with API: {error}"
+            ) from error
+        finally:
+            await self.coordinator.async_request_refresh()
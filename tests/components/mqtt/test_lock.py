@@ -1,5 +1,5 @@
 """The tests for the MQTT lock platform."""
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,12 +12,17 @@ from homeassistant.components.lock import (
     STATE_UNLOCKED,
     SUPPORT_OPEN,
 )
-from homeassistant.components.mqtt.lock import MQTT_LOCK_ATTRIBUTES_BLOCKED
+from homeassistant.components.mqtt.lock import (
+    MQTT_LOCK_ATTRIBUTES_BLOCKED,
+    MqttLock,
+    _async_batch_add_entities,
+)
 from homeassistant.const import (
     ATTR_ASSUMED_STATE,
     ATTR_ENTITY_ID,
     ATTR_SUPPORTED_FEATURES,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.setup import async_setup_component
 
 from .test_common import (
@@ -48,7 +53,7 @@ from .test_common import (
     help_test_update_with_json_attrs_not_dict,
 )
 
-from tests.common import async_fire_mqtt_message
+from tests.common import MockConfigEntry, async_fire_mqtt_message
 
 DEFAULT_CONFIG = {
     LOCK_DOMAIN: {"platform": "mqtt", "name": "test", "command_topic": "test-topic"}
@@ -91,6 +96,38 @@ async def test_controlling_state_via_topic(hass, mqtt_mock):
     assert state.state is STATE_UNLOCKED
 
 
+async def test_state_not_written_without_change(hass, mqtt_mock):
+    """Test unknown or repeated state payloads do not write state."""
+    assert await async_setup_component(
+        hass,
+        LOCK_DOMAIN,
+        {
+            LOCK_DOMAIN: {
+                "platform": "mqtt",
+                "name": "test",
+                "state_topic": "state-topic",
+                "command_topic": "command-topic",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    async_fire_mqtt_message(hass, "state-topic", "LOCKED")
+    state = hass.states.get("lock.test")
+    assert state.state is STATE_LOCKED
+    last_updated = state.last_updated
+
+    with patch.object(MqttLock, "async_write_ha_state") as mock_write:
+        async_fire_mqtt_message(hass, "state-topic", "JAMMED")
+        async_fire_mqtt_message(hass, "state-topic", "LOCKED")
+        await hass.async_block_till_done()
+
+    mock_write.assert_not_called()
+    state = hass.states.get("lock.test")
+    assert state.state is STATE_LOCKED
+    assert state.last_updated == last_updated
+
+
 async def test_controlling_non_default_state_via_topic(hass, mqtt_mock):
     """Test the controlling state via topic."""
     assert await async_setup_component(
@@ -288,6 +325,37 @@ async def test_sending_mqtt_commands_and_explicit_optimistic(hass, mqtt_mock):
     assert state.attributes.get(ATTR_ASSUMED_STATE)
 
 
+async def test_sending_mqtt_open_command_without_payload_open(hass, mqtt_mock):
+    """Test open does nothing when no open payload is configured."""
+    assert await async_setup_component(
+        hass,
+        LOCK_DOMAIN,
+        {
+            LOCK_DOMAIN: {
+                "platform": "mqtt",
+                "name": "test",
+                "command_topic": "command-topic",
+            }
+        },
+    )
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        LOCK_DOMAIN, SERVICE_LOCK, {ATTR_ENTITY_ID: "lock.test"}, blocking=True
+    )
+    mqtt_mock.async_publish.reset_mock()
+    state = hass.states.get("lock.test")
+    assert state.state is STATE_LOCKED
+    assert not state.attributes.get(ATTR_SUPPORTED_FEATURES)
+
+    await hass.services.async_call(
+        LOCK_DOMAIN, SERVICE_OPEN, {ATTR_ENTITY_ID: "lock.test"}, blocking=True
+    )
+
+    mqtt_mock.async_publish.assert_not_called()
+    assert hass.states.get("lock.test").state is STATE_LOCKED
+
+
 async def test_sending_mqtt_commands_support_open_and_optimistic(hass, mqtt_mock):
     """Test open function of the lock without state topic."""
     assert await async_setup_component(
@@ -545,6 +613,66 @@ async def test_discovery_broken(hass, mqtt_mock, caplog):
     await help_test_discovery_broken(hass, mqtt_mock, caplog, LOCK_DOMAIN, data1, data2)
 
 
+async def test_discovery_adds_entities_in_batches(hass, mqtt_mock):
+    """Test locks discovered in one loop iteration are added together."""
+    async_fire_mqtt_message(
+        hass,
+        "homeassistant/lock/bla0/config",
+        '{ "name": "Beer0", "command_topic": "test_topic" }',
+    )
+    await hass.async_block_till_done()
+    assert hass.states.get("lock.beer0") is not None
+
+    with patch.object(
+        EntityPlatform,
+        "async_add_entities",
+        autospec=True,
+        side_effect=EntityPlatform.async_add_entities,
+    ) as mock_add_entities:
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/lock/bla1/config",
+            '{ "name": "Beer1", "command_topic": "test_topic" }',
+        )
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/lock/bla2/config",
+            '{ "name": "Beer2", "command_topic": "test_topic" }',
+        )
+        await hass.async_block_till_done()
+
+    assert mock_add_entities.call_count == 1
+    entities = mock_add_entities.call_args[0][1]
+    assert [entity.name for entity in entities] == ["Beer1", "Beer2"]
+    assert hass.states.get("lock.beer1") is not None
+    assert hass.states.get("lock.beer2") is not None
+
+
+async def test_discovery_batch_update_before_add(hass):
+    """Test entities requesting an update before add are not queued."""
+    entry = MockConfigEntry(domain="mqtt")
+    async_add_entities = MagicMock()
+    add_entities = _async_batch_add_entities(hass, entry, async_add_entities)
+    entity = MagicMock()
+
+    add_entities([entity], update_before_add=True)
+
+    async_add_entities.assert_called_once_with([entity], update_before_add=True)
+
+
+async def test_discovery_batch_dropped_on_unload(hass):
+    """Test queued locks are not added once the config entry is unloaded."""
+    entry = MockConfigEntry(domain="mqtt")
+    async_add_entities = MagicMock()
+    add_entities = _async_batch_add_entities(hass, entry, async_add_entities)
+
+    add_entities([MagicMock()])
+    entry._async_process_on_unload()
+    await hass.async_block_till_done()
+
+    async_add_entities.assert_not_called()
+
+
 async def test_entity_device_info_with_connection(hass, mqtt_mock):
     """Test MQTT lock device registry integration."""
     await help_test_entity_device_info_with_connection(
@@ -1,4 +1,5 @@
 """Tests for the Plugwise Climate integration."""
+from unittest.mock import patch
 
 from plugwise.exceptions import PlugwiseException
 import pytest
@@ -8,7 +9,10 @@ from homeassistant.components.climate.const import (
     HVAC_MODE_HEAT,
     HVAC_MODE_OFF,
 )
+from homeassistant.components.plugwise.climate import PlugwiseClimateEntity
+from homeassistant.components.plugwise.const import DOMAIN
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.exceptions import HomeAssistantError
 
 from tests.components.plugwise.common import async_init_integration
@@ -94,6 +98,22 @@ async def test_adam_climate_adjust_negative_testing(hass, mock_smile_adam):
     attrs = state.attributes
 
 
+async def test_adam_climate_set_temperature_out_of_range(hass, mock_smile_adam):
+    """Test setting a temperature outside of the supported range."""
+    entry = await async_init_integration(hass, mock_smile_adam)
+    assert entry.state is ConfigEntryState.LOADED
+
+    with pytest.raises(ValueError):
+        await hass.services.async_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.zone_lisa_wk", "temperature": 50},
+            blocking=True,
+        )
+
+    assert mock_smile_adam.set_temperature.call_count == 0
+
+
 async def test_adam_climate_entity_climate_changes(hass, mock_smile_adam):
     """Test handling of user requests in adam climate device environment."""
     entry = await async_init_integration(hass, mock_smile_adam)
@@ -148,6 +168,40 @@ async def test_adam_climate_entity_climate_changes(hass, mock_smile_adam):
     )
 
 
+async def test_adam_climate_state_written_on_change(hass, mock_smile_adam):
+    """Test climate state is only written when it changed."""
+    entry = await async_init_integration(hass, mock_smile_adam)
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    last_updated = hass.states.get("climate.zone_lisa_wk").last_updated
+
+    with patch.object(PlugwiseClimateEntity, "async_write_ha_state") as mock_write:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+    mock_write.assert_not_called()
+    assert hass.states.get("climate.zone_lisa_wk").last_updated == last_updated
+
+    coordinator.data.devices["b59bcebaf94b499ea7d46e4a66fb62d8"]["sensors"][
+        "temperature"
+    ] = 21.3
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get("climate.zone_lisa_wk")
+    assert state.attributes["current_temperature"] == 21.3
+    assert state.last_updated != last_updated
+
+    async_update = mock_smile_adam.async_update.side_effect
+    mock_smile_adam.async_update.side_effect = PlugwiseException
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("climate.zone_lisa_wk").state == STATE_UNAVAILABLE
+
+    mock_smile_adam.async_update.side_effect = async_update
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("climate.zone_lisa_wk").state == HVAC_MODE_AUTO
+
+
 async def test_anna_climate_entity_attributes(hass, mock_smile_anna):
     """Test creation of anna climate device environment."""
     entry = await async_init_integration(hass, mock_smile_anna)
@@ -1,10 +1,14 @@
 """Tests for the Plugwise switch integration."""
+from unittest.mock import call, patch
+
 from plugwise.exceptions import PlugwiseException
 import pytest
 
 from homeassistant.components.plugwise.const import DOMAIN
+from homeassistant.components.plugwise.switch import PlugwiseSwitchEntity
 from homeassistant.components.switch import DOMAIN as SWITCH_DOMAIN
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import STATE_OFF, STATE_UNAVAILABLE
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
@@ -62,41 +66,57 @@ async def test_adam_climate_switch_changes(hass, mock_smile_adam):
     entry = await async_init_integration(hass, mock_smile_adam)
     assert entry.state is ConfigEntryState.LOADED
 
-    await hass.services.async_call(
-        "switch",
-        "turn_off",
-        {"entity_id": "switch.cv_pomp_relay"},
-        blocking=True,
-    )
+    for service, entity_id in (
+        ("turn_off", "switch.cv_pomp_relay"),
+        ("toggle", "switch.fibaro_hc2_relay"),
+        ("turn_on", "switch.fibaro_hc2_relay"),
+    ):
+        await hass.services.async_call("switch", service, {"entity_id": entity_id})
+    await hass.async_block_till_done()
 
-    assert mock_smile_adam.set_switch_state.call_count == 1
-    mock_smile_adam.set_switch_state.assert_called_with(
-        "78d1126fc4c743db81b61c20e88342a7", None, "relay", "off"
+    assert mock_smile_adam.set_switch_state.call_count == 3
+    mock_smile_adam.set_switch_state.assert_has_calls(
+        [
+            call("78d1126fc4c743db81b61c20e88342a7", None, "relay", "off"),
+            call("a28f588dc4a049a483fd03a30361ad3a", None, "relay", "off"),
+            call("a28f588dc4a049a483fd03a30361ad3a", None, "relay", "on"),
+        ],
+        any_order=True,
     )
 
-    await hass.services.async_call(
-        "switch",
-        "toggle",
-        {"entity_id": "switch.fibaro_hc2_relay"},
-        blocking=True,
-    )
 
-    assert mock_smile_adam.set_switch_state.call_count == 2
-    mock_smile_adam.set_switch_state.assert_called_with(
-        "a28f588dc4a049a483fd03a30361ad3a", None, "relay", "off"
-    )
+async def test_adam_switch_state_written_on_change(hass, mock_smile_adam):
+    """Test switch state is only written when it changed."""
+    entry = await async_init_integration(hass, mock_smile_adam)
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    last_updated = hass.states.get("switch.cv_pomp_relay").last_updated
+
+    with patch.object(PlugwiseSwitchEntity, "async_write_ha_state") as mock_write:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+    mock_write.assert_not_called()
+    assert hass.states.get("switch.cv_pomp_relay").last_updated == last_updated
+
+    coordinator.data.devices["78d1126fc4c743db81b61c20e88342a7"]["switches"][
+        "relay"
+    ] = False
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    state = hass.states.get("switch.cv_pomp_relay")
+    assert state.state == STATE_OFF
+    assert state.last_updated != last_updated
 
-    await hass.services.async_call(
-        "switch",
-        "turn_on",
-        {"entity_id": "switch.fibaro_hc2_relay"},
-        blocking=True,
-    )
+    async_update = mock_smile_adam.async_update.side_effect
+    mock_smile_adam.async_update.side_effect = PlugwiseException
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.cv_pomp_relay").state == STATE_UNAVAILABLE
 
-    assert mock_smile_adam.set_switch_state.call_count == 3
-    mock_smile_adam.set_switch_state.assert_called_with(
-        "a28f588dc4a049a483fd03a30361ad3a", None, "relay", "on"
-    )
+    mock_smile_adam.async_update.side_effect = async_update
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("switch.cv_pomp_relay").state == STATE_OFF
 
 
 async def test_stretch_switch_entities(hass, mock_stretch):